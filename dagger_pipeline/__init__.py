@@ -34,3 +34,15 @@ For CLI usage, see the `main` module documentation.
 """
 
 __version__ = "0.1.0"
+
+__all__ = ["Pipeline"]
+
+
+def __getattr__(name: str):
+    # Resolve Pipeline on first access so that importing the package, as the
+    # CLI does, does not load the Dagger SDK.
+    if name == "Pipeline":
+        from .pipeline import Pipeline
+
+        return Pipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
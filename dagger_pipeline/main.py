@@ -38,23 +38,172 @@ The CLI is organized into command groups:
 - `ci`: Complete CI pipeline execution
 - `version`: Version management commands
 - `setup`: Development environment setup
+- `warmup`: Pre-pull container images for faster first runs
 """
 
 import asyncio
-import sys
+import functools
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.panel import Panel
 
-from .pipeline import Pipeline
+# rich and the Dagger SDK are imported on first use so that `--help`,
+# `--version` and shell completion do not pay for them.
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+    from .pipeline import Pipeline
+
+
+@functools.cache
+def _console() -> "Console":
+    """Return the console shared by all commands, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _header(title: str) -> None:
+    """Print a command's title panel, or just the title when output is not a terminal."""
+    console = _console()
+    if not console.is_terminal:
+        console.out(title)
+        return
+
+    from rich.panel import Panel
+
+    console.print(Panel.fit(title, style="bold blue"))
+
+
+class PipelineError(click.ClickException):
+    """A command failure, reported in the CLI's console style."""
+
+    def show(self, file=None) -> None:
+        _console().print(f"❌ {self.message}", style="bold red")
+
+
+def _get_pipeline(ctx: click.Context, verbose: bool) -> "Pipeline":
+    """Return the Pipeline shared by every command run in this CLI process."""
+    from .pipeline import Pipeline
+
+    state = ctx.ensure_object(dict)
+    if "pipeline" not in state:
+        state["pipeline"] = Pipeline(verbose=verbose)
+    return state["pipeline"]
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the CLI's event loop, using uvloop where it is available."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _run(ctx: click.Context, coro):
+    """Drive a command coroutine on the event loop shared by this CLI process."""
+    state = ctx.ensure_object(dict)
+    if "loop" not in state:
+        state["loop"] = _new_event_loop()
+    return state["loop"].run_until_complete(coro)
+
+
+class _TieredRunner:
+    """Run coroutine factories level by level.
+
+    Tasks added at the same level run concurrently; a level starts only once
+    every task of the previous level has finished. If any task fails, its
+    siblings are cancelled and the first failure is re-raised, so callers can
+    handle it like any other exception.
+    """
+
+    def __init__(self):
+        self._levels: dict[int, list[Callable[[], Awaitable[None]]]] = defaultdict(list)
+
+    def add(self, level: int, coro_factory: Callable[[], Awaitable[None]]) -> None:
+        """Schedule a coroutine factory to run at the given level."""
+        self._levels[level].append(coro_factory)
+
+    async def run(self) -> None:
+        """Run all levels in ascending order."""
+        for level in sorted(self._levels):
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for coro_factory in self._levels[level]:
+                        tg.create_task(coro_factory())
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0] from None
+
+
+def _close(state: dict) -> None:
+    """Close the shared Dagger session and event loop once the CLI exits."""
+    loop = state.pop("loop", None)
+    if loop is None:
+        return
+    try:
+        # Cancel anything still in flight (e.g. after Ctrl+C) before closing the session
+        pending = asyncio.all_tasks(loop)
+        if pending:
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+        pipeline = state.pop("pipeline", None)
+        if pipeline is not None:
+            loop.run_until_complete(pipeline.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+def pipeline_command(title: str, success: str | None, failure: str):
+    """Turn an async ``fn(pipeline, **options)`` into a Click command callback.
+
+    The wrapped callback adds the shared ``--verbose`` option, prints the title
+    panel, runs ``fn`` with the process-wide Pipeline on the shared event loop,
+    and reports success in a single place. Failures are raised as
+    `PipelineError`, so Click sets the exit code and the context close hook
+    still shuts down the Dagger session; with ``--verbose`` the traceback is
+    printed first.
+
+    Args:
+        title: Text of the panel printed before the command runs.
+        success: Message printed when the command succeeds, or None to print nothing.
+        failure: Prefix of the error message printed when the command fails.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[None]]) -> Callable[..., None]:
+        @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+        @functools.wraps(fn)
+        def wrapper(verbose: bool, **kwargs) -> None:
+            ctx = click.get_current_context()
+            _header(title)
+
+            async def run():
+                try:
+                    await fn(_get_pipeline(ctx, verbose), **kwargs)
+                except Exception as e:
+                    if verbose:
+                        _console().print_exception()
+                    raise PipelineError(f"{failure}: {e}") from e
+
+                if success:
+                    _console().print(success, style="bold green")
+
+            _run(ctx, run())
+
+        return wrapper
+
+    return decorator
 
 
 @click.group()
 @click.version_option()
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """CSS Kustomize Dagger Pipeline - Comprehensive automation for linting, validation, and deployment.
 
     This CLI provides a comprehensive suite of tools for managing Kubernetes manifests
@@ -64,22 +213,45 @@ def cli():
     The pipeline ensures code quality, and consistent deployment
     practices across different environments and overlays.
     """
-    pass
+    state = ctx.ensure_object(dict)
+    ctx.call_on_close(lambda: _close(state))
+
+
+# Maps each `lint --<check>-only` flag to the Pipeline method that runs the check
+_LINT_CHECKS = {
+    "yaml_only": "lint_yaml",
+    "python_only": "lint_python",
+    "markdown_only": "lint_markdown",
+    "kustomize_only": "validate_kustomize",
+    "security_only": "security_scan",
+}
 
 
 @cli.command()
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def lint(
-    verbose: bool,
-):
+@click.option("--yaml-only", is_flag=True, help="Run YAML linting")
+@click.option("--python-only", is_flag=True, help="Run Python linting and format checks")
+@click.option("--markdown-only", is_flag=True, help="Run Markdown format checks")
+@click.option("--kustomize-only", is_flag=True, help="Run Kustomize validation")
+@click.option("--security-only", is_flag=True, help="Run the security scan of overlay manifests")
+@click.option(
+    "--jobs",
+    "-j",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Checks to run at once; 1 runs them serially (default: CPU count)",
+)
+@pipeline_command("🔍 CSS Kustomize Linting Pipeline", "🎉 All linting checks passed!", "Linting failed")
+async def lint(pipeline: "Pipeline", jobs: int, **checks: bool):
     """Run comprehensive linting and validation checks.
 
     This command performs various code quality and configuration validation checks
     on the project. By default, it runs all available linting checks, but can be
-    configured to run specific checks only.
+    configured to run specific checks only. The `--*-only` flags can be combined;
+    the selected checks then run concurrently, at most `jobs` at a time.
 
     Args:
-        verbose: If True, enable detailed output during execution
+        jobs: Maximum number of checks to run at once. 1 runs them one after
+              another; 0 uses the number of CPUs.
 
     The linting includes:
     - YAML syntax and style validation
@@ -93,32 +265,28 @@ def lint(
         Run all linting checks:
             $ poetry run dagger-pipeline lint
 
+        Run only YAML and Python checks:
+            $ poetry run dagger-pipeline lint --yaml-only --python-only
+
         Run with verbose output:
             $ poetry run dagger-pipeline lint --verbose
     """
-
-    console.print(Panel.fit("🔍 CSS Kustomize Linting Pipeline", style="bold blue"))
-
-    async def run_lint():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.run_all_linting()
-
-            console.print("🎉 All linting checks passed!", style="bold green")
-
-        except Exception as e:
-            console.print(f"❌ Linting failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_lint())
+    selected = [method for flag, method in _LINT_CHECKS.items() if checks[flag]]
+    await pipeline.run_checks(*selected, jobs=jobs or None)
 
 
 @cli.command()
 @click.option("--overlay", help="Specific overlay to generate (e.g., with-pvc)")
 @click.option("--output-dir", default="manifests", help="Output directory for generated manifests")
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def generate(overlay: str | None, output_dir: str, verbose: bool):
+@click.option(
+    "--jobs",
+    "-j",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Overlays to build at once; 1 builds them serially (default: CPU count)",
+)
+@pipeline_command("🏗️ CSS Kustomize Generation Pipeline", "🎉 Manifest generation completed!", "Generation failed")
+async def generate(pipeline: "Pipeline", overlay: str | None, output_dir: str, jobs: int):
     """Generate Kustomize manifests for overlays.
 
     This command uses Kustomize to build and generate Kubernetes manifests
@@ -130,7 +298,8 @@ def generate(overlay: str | None, output_dir: str, verbose: bool):
                 If None, generates manifests for all overlays.
         output_dir: Directory where generated manifests will be saved.
                    Defaults to 'manifests'.
-        verbose: If True, enable detailed output during generation.
+        jobs: Maximum number of overlays to build at once. 1 builds them one
+              after another; 0 uses the number of CPUs.
 
     The generated manifests include all Kubernetes resources defined in the
     base configuration and modified by the overlay-specific patches and
@@ -146,31 +315,18 @@ def generate(overlay: str | None, output_dir: str, verbose: bool):
         Generate to custom directory:
             $ poetry run dagger-pipeline generate --output-dir ./output
     """
-
-    console.print(Panel.fit("🏗️ CSS Kustomize Generation Pipeline", style="bold blue"))
-
-    async def run_generate():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            if overlay:
-                await pipeline.generate_overlay(overlay, output_dir)
-            else:
-                await pipeline.generate_all_overlays(output_dir)
-
-            console.print("🎉 Manifest generation completed!", style="bold green")
-
-        except Exception as e:
-            console.print(f"❌ Generation failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_generate())
+    if overlay:
+        await pipeline.generate_overlay(overlay, output_dir)
+    elif jobs == 1:
+        await pipeline.generate_all_overlays(output_dir)
+    else:
+        await pipeline.generate_all_overlays_parallel(output_dir, jobs=jobs or None)
 
 
 @cli.command()
 @click.option("--output-dir", default="manifests", help="Output directory for generated manifests")
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def ci(output_dir: str, verbose: bool):
+@pipeline_command("🚀 CSS Kustomize CI Pipeline", "🎉 Complete CI pipeline passed!", "CI pipeline failed")
+async def ci(pipeline: "Pipeline", output_dir: str):
     """Run complete CI pipeline (lint, validate, generate).
 
     This is the main CI command that executes the full pipeline workflow.
@@ -179,14 +335,12 @@ def ci(output_dir: str, verbose: bool):
     Args:
         output_dir: Directory where generated manifests will be saved.
                    Defaults to 'manifests'.
-        verbose: If True, enable detailed output during execution.
 
     The CI pipeline includes:
-    1. Comprehensive linting (YAML, Python, Markdown)
-    2. Kustomize configuration validation
-    3. Security scanning of configurations
-    4. Manifest generation for all overlays
-    5. Security scanning of generated manifests
+    1. Comprehensive linting (YAML, Python, Markdown), Kustomize
+       configuration validation and security scanning of configurations
+    2. Manifest generation for all overlays, run concurrently with step 1
+    3. Security scanning of generated manifests
 
     This command is designed to be run in CI/CD environments to ensure
     code quality and deployment readiness.
@@ -201,49 +355,38 @@ def ci(output_dir: str, verbose: bool):
         Generate to custom directory:
             $ poetry run dagger-pipeline ci --output-dir ./build
     """
-
-    console.print(Panel.fit("🚀 CSS Kustomize CI Pipeline", style="bold blue"))
-
-    async def run_ci():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            # Run all linting checks
-            await pipeline.run_all_linting()
-            console.print("✅ Linting completed", style="green")
-
-            # Generate all overlays
-            await pipeline.generate_all_overlays(output_dir)
-            console.print("✅ Manifest generation completed", style="green")
-
-            console.print("🎉 Complete CI pipeline passed!", style="bold green")
-
-        except Exception as e:
-            console.print(f"❌ CI pipeline failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_ci())
+    # Linting does not depend on generation, so both run at level 1;
+    # the security scan needs the generated manifests. Linting must not see
+    # the output while it is being written.
+    pipeline.exclude_output_dir(output_dir)
+    runner = _TieredRunner()
+    runner.add(1, pipeline.run_all_linting_parallel)
+    runner.add(1, lambda: pipeline.generate_all_overlays_parallel(output_dir))
+    runner.add(2, lambda: pipeline.security_scan_generated(output_dir))
+    await runner.run()
 
 
 @cli.command()
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def setup(verbose: bool):
+@pipeline_command("⚙️ CSS Kustomize Setup", "🎉 Environment setup completed!", "Setup failed")
+async def setup(pipeline: "Pipeline"):
     """Set up development environment and install dependencies."""
+    await pipeline.setup_environment()
 
-    console.print(Panel.fit("⚙️ CSS Kustomize Setup", style="bold blue"))
-
-    async def run_setup():
-        pipeline = Pipeline(verbose=verbose)
 
-        try:
-            await pipeline.setup_environment()
-            console.print("🎉 Environment setup completed!", style="bold green")
+@cli.command()
+@pipeline_command("🔥 CSS Kustomize Warmup", "🎉 Warmup completed!", "Warmup failed")
+async def warmup(pipeline: "Pipeline"):
+    """Pre-pull images and build tool containers to avoid cold starts.
 
-        except Exception as e:
-            console.print(f"❌ Setup failed: {e}", style="bold red")
-            sys.exit(1)
+    Run this once against a fresh Dagger engine, e.g. at the start of a CI job,
+    so that the first real command does not pay for image pulls and tool
+    installation.
 
-    asyncio.run(run_setup())
+    Examples:
+        Warm up the Dagger cache:
+            $ poetry run dagger-pipeline warmup
+    """
+    await pipeline.prewarm_images()
 
 
 @cli.group()
@@ -257,107 +400,48 @@ def docs():
 @click.option("--alias", default="latest", help="Version alias (default: latest)")
 @click.option("--set-default", is_flag=True, help="Set this version as default")
 @click.option("--title", help="Version title for display (defaults to version)")
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def deploy(version: str | None, alias: str, set_default: bool, title: str | None, verbose: bool):
+@pipeline_command(
+    "📚 CSS Kustomize Documentation Deployment",
+    "🎉 Documentation deployed successfully!",
+    "Documentation deployment failed",
+)
+async def deploy(pipeline: "Pipeline", version: str | None, alias: str, set_default: bool, title: str | None):
     """Deploy documentation with version management using mike."""
-
-    console.print(Panel.fit("📚 CSS Kustomize Documentation Deployment", style="bold blue"))
-
-    async def run_docs_deploy():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.deploy_docs(version, alias, set_default, title)
-            console.print("🎉 Documentation deployed successfully!", style="bold green")
-
-        except Exception as e:
-            console.print(f"❌ Documentation deployment failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_docs_deploy())
+    await pipeline.deploy_docs(version, alias, set_default, title)
 
 
 @docs.command()
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def build(verbose: bool):
+@pipeline_command(
+    "🏗️ CSS Kustomize Documentation Build",
+    "🎉 Documentation built successfully!",
+    "Documentation build failed",
+)
+async def build(pipeline: "Pipeline"):
     """Build documentation locally for testing."""
-
-    console.print(Panel.fit("🏗️ CSS Kustomize Documentation Build", style="bold blue"))
-
-    async def run_docs_build():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.build_docs()
-            console.print("🎉 Documentation built successfully!", style="bold green")
-
-        except Exception as e:
-            console.print(f"❌ Documentation build failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_docs_build())
+    await pipeline.build_docs()
 
 
 @docs.command()
 @click.option("--port", default=8000, help="Port to serve documentation on")
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def serve(port: int, verbose: bool):
+@pipeline_command("🌐 CSS Kustomize Documentation Server", None, "Documentation server failed")
+async def serve(pipeline: "Pipeline", port: int):
     """Serve documentation locally for development."""
-
-    console.print(Panel.fit("🌐 CSS Kustomize Documentation Server", style="bold blue"))
-
-    async def run_docs_serve():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.serve_docs(port)
-
-        except Exception as e:
-            console.print(f"❌ Documentation server failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_docs_serve())
+    await pipeline.serve_docs(port)
 
 
 @docs.command()
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def list_versions(verbose: bool):
+@pipeline_command("📋 CSS Kustomize Documentation Versions", None, "Failed to list versions")
+async def list_versions(pipeline: "Pipeline"):
     """List all deployed documentation versions."""
-
-    console.print(Panel.fit("📋 CSS Kustomize Documentation Versions", style="bold blue"))
-
-    async def run_list_versions():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.list_doc_versions()
-
-        except Exception as e:
-            console.print(f"❌ Failed to list versions: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_list_versions())
+    await pipeline.list_doc_versions()
 
 
 @docs.command()
 @click.argument("version")
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def delete_version(version: str, verbose: bool):
+@pipeline_command("🗑️ CSS Kustomize Documentation Version Deletion", None, "Failed to delete version")
+async def delete_version(pipeline: "Pipeline", version: str):
     """Delete a specific documentation version."""
-
-    console.print(Panel.fit("🗑️ CSS Kustomize Documentation Version Deletion", style="bold blue"))
-
-    async def run_delete_version():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.delete_doc_version(version)
-
-        except Exception as e:
-            console.print(f"❌ Failed to delete version: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_delete_version())
+    await pipeline.delete_doc_version(version)
 
 
 @cli.group()
@@ -370,72 +454,32 @@ def version():
 @click.argument("new_version")
 @click.option("--overlay", help="Update specific overlay only (e.g., with-base, with-pvc)")
 @click.option("--dry-run", is_flag=True, help="Show what would be changed without making changes")
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def update(new_version: str, overlay: str | None, dry_run: bool, verbose: bool):
+@pipeline_command("🏷️ CSS Kustomize Version Update", None, "Version update failed")
+async def update(pipeline: "Pipeline", new_version: str, overlay: str | None, dry_run: bool):
     """Update image tags and version labels across overlays."""
+    if overlay:
+        await pipeline.update_overlay_version(overlay, new_version, dry_run)
+    else:
+        await pipeline.update_all_versions(new_version, dry_run)
 
-    console.print(Panel.fit("🏷️ CSS Kustomize Version Update", style="bold blue"))
-
-    async def run_version_update():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            if overlay:
-                await pipeline.update_overlay_version(overlay, new_version, dry_run)
-            else:
-                await pipeline.update_all_versions(new_version, dry_run)
-
-            if dry_run:
-                console.print("🔍 Dry run completed. No changes were made.", style="bold yellow")
-            else:
-                console.print(f"🎉 Version updated to {new_version}!", style="bold green")
-
-        except Exception as e:
-            console.print(f"❌ Version update failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_version_update())
+    if dry_run:
+        _console().print("🔍 Dry run completed. No changes were made.", style="bold yellow")
+    else:
+        _console().print(f"🎉 Version updated to {new_version}!", style="bold green")
 
 
 @version.command()
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def validate(verbose: bool):
+@pipeline_command("🔍 CSS Kustomize Version Validation", "🎉 Version validation passed!", "Version validation failed")
+async def validate(pipeline: "Pipeline"):
     """Validate version consistency across all overlays."""
-
-    console.print(Panel.fit("🔍 CSS Kustomize Version Validation", style="bold blue"))
-
-    async def run_version_validate():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.validate_version_consistency()
-            console.print("🎉 Version validation passed!", style="bold green")
-
-        except Exception as e:
-            console.print(f"❌ Version validation failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_version_validate())
+    await pipeline.validate_version_consistency()
 
 
 @version.command()
-@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def report(verbose: bool):
+@pipeline_command("📊 CSS Kustomize Version Report", None, "Version report failed")
+async def report(pipeline: "Pipeline"):
     """Generate version report showing current versions across overlays."""
-
-    console.print(Panel.fit("📊 CSS Kustomize Version Report", style="bold blue"))
-
-    async def run_version_report():
-        pipeline = Pipeline(verbose=verbose)
-
-        try:
-            await pipeline.generate_version_report()
-
-        except Exception as e:
-            console.print(f"❌ Version report failed: {e}", style="bold red")
-            sys.exit(1)
-
-    asyncio.run(run_version_report())
+    await pipeline.generate_version_report()
 
 
 if __name__ == "__main__":